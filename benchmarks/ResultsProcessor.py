@@ -1,29 +1,49 @@
+import io
+import functools
 import numpy as np
 import pandas as pd
-import matplotlib
 from pathlib import Path
-import matplotlib.pyplot as plt
-import matplotlib.colors as mcolors
-from matplotlib.cm import ScalarMappable
-matplotlib.use('TkAgg')  # or 'Qt5Agg' if you have PyQt5 installed
+from typing import List, Optional
+from concurrent.futures import Executor, Future
+# matplotlib is imported inside the plotting methods so table-only runs never load it
+
+# Fixed-width layout of the text table, newline included; problem rows and the totals
+# row share one format
+_HEADER_FMT = "{:<8} {:<10} {:<10} {:<8} {:<10} {:<10} {:<8} {:<10} {:<10} {:<6}\n"
+_ROW_FMT = "{:<8} {:<10.2f} {:<10.2f} {:<8.2f} {:<10.2f} {:<10.2f} {:<8.2f} {:<10} {:<10.2f} {:<6}\n"
+_RULE = "-" * 95 + "\n"
 
 class ResultsProcessor:
     """Combines performance results table generation and visualization plotting"""
 
-    def __init__(self, challenge_id, problem_title):
-        self.table_lines = []
+    def __init__(self, challenge_id, problem_title, interactive: bool = False):
+        self._table = io.StringIO()
         self.challenge_id = challenge_id
         self.problem_title = problem_title
+        # Only an interactive session goes through pyplot and opens a plot window
+        self.interactive = interactive
 
     # Table generation methods
     def generate_table(self, file_info, times_taken, peak_memory_usage, iterations, challenge):
         """Create results table and DataFrame"""
         stats = self._calculate_stats(times_taken, peak_memory_usage)
         
-        # Initialize containers for both outputs
-        self.table_lines = []
-        df_data = []
-        total_lines, total_size = 0, 0.0
+        # Extract per-problem stats into aligned arrays once
+        self._table = table = io.StringIO()
+        problems = sorted(k for k in stats.keys() if k != 'total')
+        total = stats['total']
+        avg_times = np.array([stats[p]['avg_time'] for p in problems], dtype=float)
+        std_times = np.array([stats[p]['std_time'] for p in problems], dtype=float)
+        avg_mems = np.array([stats[p]['avg_mem'] for p in problems], dtype=float)
+        std_mems = np.array([stats[p]['std_mem'] for p in problems], dtype=float)
+        time_pct = avg_times / total['time'] * 100 if total['time'] > 0 else np.zeros_like(avg_times)
+        mem_pct = avg_mems / total['memory'] * 100 if total['memory'] > 0 else np.zeros_like(avg_mems)
+
+        info = [file_info.get(p, ("", 0, 0.0)) for p in problems]
+        langs = [lang for lang, _, _ in info]
+        sizes = np.array([size for _, _, size in info], dtype=float)
+        lines = np.array([line_count for _, line_count, _ in info], dtype=int)
+        total_lines, total_size = int(lines.sum()), float(sizes.sum())
         
         # Build headers
         headers = [self.problem_title, "Avg(ms)", "STD(ms)", "Time%", 
@@ -31,100 +51,91 @@ class ResultsProcessor:
                   "Lang", "Size(kB)", "Lines"]
         
         # Table header
-        self.table_lines.append(
-            "{:<8} {:<10} {:<10} {:<8} {:<10} {:<10} {:<8} {:<10} {:<10} {:<6}".format(*headers)
-        )
-        self.table_lines.append("-" * 95)
+        table.write(_HEADER_FMT.format(*headers))
+        table.write(_RULE)
         
-        # Process each problem
-        for problem in sorted(k for k in stats.keys() if k != 'total'):
-            s = stats[problem]
-            time_pct = (s['avg_time'] / stats['total']['time'] * 100) if stats['total']['time'] > 0 else 0
-            mem_pct = (s['avg_mem'] / stats['total']['memory'] * 100) if stats['total']['memory'] > 0 else 0
-            
-            lang, lines, size = file_info.get(problem, ("", 0, 0.0))
-            total_lines += lines
-            total_size += size
-            
-            # Add to table lines
-            self.table_lines.append(
-                "{:<8} {:<10.2f} {:<10.2f} {:<8.2f} {:<10.2f} {:<10.2f} {:<8.2f} {:<10} {:<10.2f} {:<6}"
-                .format(problem, s['avg_time'], s['std_time'], time_pct,
-                        s['avg_mem'], s['std_mem'], mem_pct,
-                        lang, size, lines)
-            )
-            
-            # Add to DataFrame data
-            df_data.append([
-                problem, s['avg_time'], s['std_time'], time_pct,
-                s['avg_mem'], s['std_mem'], mem_pct,
-                lang, size, lines
-            ])
+        # Process each problem, formatting straight from the column arrays
+        table.writelines(map(_ROW_FMT.format, problems, avg_times, std_times, time_pct,
+                             avg_mems, std_mems, mem_pct, langs, sizes, lines))
         
         # Add totals
-        self.table_lines.extend([
-            "-" * 95,
-            "{:<8} {:<10.2f} {:<10.2f} {:<8.2f} {:<10.2f} {:<10.2f} {:<8.2f} {:<10} {:<10.2f} {:<6}"
-            .format("Total", stats['total']['time'], stats['total']['time_std'], 100,
-                    stats['total']['memory'], stats['total']['memory_std'], 100,
+        table.writelines([
+            _RULE,
+            _ROW_FMT.format("Total", total['time'], total['time_std'], 100,
+                    total['memory'], total['memory_std'], 100,
                     "", total_size, total_lines),
-            f"\nChallenge: {challenge}, Iterations: {iterations}"
+            f"\nChallenge: {challenge}, Iterations: {iterations}\n"
         ])
         
-        # Add totals to DataFrame
-        df_data.append([
-            "Total", stats['total']['time'], stats['total']['time_std'], 100,
-            stats['total']['memory'], stats['total']['memory_std'], 100,
-            "", total_size, total_lines
-        ])
-        
-        # Create DataFrame
-        df = pd.DataFrame(df_data, columns=[
-            self.problem_title, "Avg(ms)", "STD(ms)", "Time%",
-            "Avg(MB)", "STD(MB)", "Memory %",
-            "Lang", "Size(kB)", "Lines"
-        ])
+        # Create DataFrame (problem rows followed by the totals row)
+        df = pd.DataFrame({
+            self.problem_title: [*problems, "Total"],
+            "Avg(ms)": np.append(avg_times, total['time']),
+            "STD(ms)": np.append(std_times, total['time_std']),
+            "Time%": np.append(time_pct, 100.0),
+            "Avg(MB)": np.append(avg_mems, total['memory']),
+            "STD(MB)": np.append(std_mems, total['memory_std']),
+            "Memory %": np.append(mem_pct, 100.0),
+            "Lang": [*langs, ""],
+            "Size(kB)": np.append(sizes, total_size),
+            "Lines": np.append(lines, total_lines),
+        })
 
         return df
 
+    @staticmethod
+    def _row_stats(rows):
+        """Mean and population std of each ragged row, computed in one pass over a NaN-padded array"""
+        width = max(map(len, rows), default=0)
+        values = np.full((len(rows), width), np.nan)
+        for i, row in enumerate(rows):
+            values[i, :len(row)] = row
+        present = ~np.isnan(values)
+        counts = present.sum(axis=1)
+        safe_counts = np.maximum(counts, 1)
+        means = np.where(present, values, 0.0).sum(axis=1) / safe_counts
+        deviations = np.where(present, values - means[:, None], 0.0)
+        stds = np.sqrt((deviations ** 2).sum(axis=1) / safe_counts)
+        # Problems without any samples report zeros, as before
+        return np.where(counts > 0, means, 0.0), np.where(counts > 0, stds, 0.0)
+
     def _calculate_stats(self, times_taken, peak_memory_usage):
         """Calculate performance statistics"""
-        stats = {}
-        total_time = total_memory = 0
-
-        for problem in times_taken:
-            times = times_taken[problem]
-            mems = peak_memory_usage.get(problem, [])
+        problems = list(times_taken)
+        avg_times, std_times = self._row_stats([times_taken[p] for p in problems])
+        avg_mems, std_mems = self._row_stats([peak_memory_usage.get(p, []) for p in problems])
 
-            avg_time = np.mean(times) if times else 0
-            std_time = np.std(times) if times else 0
-            avg_mem = np.mean(mems) if mems else 0
-            std_mem = np.std(mems) if mems else 0
-
-            stats[problem] = {
+        stats = {
+            problem: {
                 'avg_time': avg_time,
                 'std_time': std_time,
                 'avg_mem': avg_mem,
                 'std_mem': std_mem
             }
+            for problem, avg_time, std_time, avg_mem, std_mem
+            in zip(problems, avg_times, std_times, avg_mems, std_mems)
+        }
 
-            total_time += avg_time
-            total_memory += avg_mem
-
+        # The runs are independent, so their variances (not their stds) add up
         stats['total'] = {
-            'time': total_time,
-            'memory': total_memory,
-            'time_std': sum(s['std_time'] for s in stats.values()),
-            'memory_std': sum(s['std_mem'] for s in stats.values())
+            'time': avg_times.sum(),
+            'memory': avg_mems.sum(),
+            'time_std': np.sqrt(std_times @ std_times),
+            'memory_std': np.sqrt(std_mems @ std_mems)
         }
 
         return stats
 
+    @property
+    def table_lines(self) -> List[str]:
+        """Lines of the last generated table, without their newlines"""
+        return self._table.getvalue().splitlines()
+
     def save_table(self, save_dir: Path):
         """Save table to text file"""
         file_path = save_dir / f"{self.challenge_id}_results.txt"
         with file_path.open('w') as f:
-            f.write("\n".join(self.table_lines))
+            f.write(self._table.getvalue())
         print(f"Results table saved to {file_path}")
 
     # Plotting methods
@@ -132,6 +143,38 @@ class ResultsProcessor:
                     iterations: int, save_dir: Path, center_color: str = "#4CAF50",
                     scale: str = 'linear'):
         """Main plotting function"""
+        self.generate_plots(df, challenge, iterations, save_dir, center_color, (scale,))
+
+    def generate_plots(self, df: pd.DataFrame, challenge: str,
+                    iterations: int, save_dir: Path, center_color: str = "#4CAF50",
+                    scales=('linear', 'log'), writer: Optional[Executor] = None) -> List[Future]:
+        """Draw the figure once and save it at every requested y-axis scale.
+
+        With a writer executor each PNG is rendered in memory and written to disk on the
+        writer, overlapping the file I/O with drawing the next scale; the write futures
+        are returned so the caller can wait for them.
+        """
+        writes: List[Future] = []
+        fig, ax, avg_times, legend = self._build_plot(df, challenge, iterations, center_color)
+        for scale in scales:
+            # Only the y-axis and the legend's scale line differ between the saved plots
+            self._apply_scale(ax, scale, avg_times, legend)
+            fig.tight_layout()
+            plot_path = save_dir / f"{self.challenge_id}_{scale}.png"
+            if writer is None:
+                fig.savefig(plot_path, bbox_inches='tight')
+            else:
+                buffer = io.BytesIO()
+                fig.savefig(buffer, format='png', bbox_inches='tight')
+                writes.append(writer.submit(plot_path.write_bytes, buffer.getvalue()))
+        if self.interactive:
+            import matplotlib.pyplot as plt
+            plt.show()
+            plt.close(fig)
+        return writes
+
+    def _build_plot(self, df: pd.DataFrame, challenge: str, iterations: int, center_color: str):
+        """Create every artist of the plot that does not depend on the y-axis scale"""
         # Data preparation
         df = df[df[self.problem_title] != 'Total']
         problems = pd.to_numeric(df[self.problem_title])
@@ -142,66 +185,84 @@ class ResultsProcessor:
 
         # Create plot elements
         fig, ax = self._setup_figure()
-        bars = self._create_bars(ax, problems, avg_times, center_color, rel_memory)
+        bars, cmap, norm = self._create_bars(ax, problems, avg_times, center_color, rel_memory)
         self._add_annotations(ax, bars, df)
-        self._configure_axes(ax, problems, avg_times, scale)
+        self._configure_axes(ax, problems)
         self._highlight_extremes(ax, bars, problems, avg_times)
         self._add_reference_lines(ax, avg_times)
         self._add_error_bars(ax, problems, avg_times, std_devs)
-        self._add_legends(ax, challenge, iterations, avg_times, avg_mems)
-        self._add_colorbar(fig, ax, center_color, rel_memory)
-
-        # Finalize and save
-        plt.tight_layout()
-        plot_path = save_dir / f"{self.challenge_id}_{scale}.png"
-        plt.savefig(plot_path, bbox_inches='tight')
-        plt.show()
+        legend = self._add_legends(ax, challenge, iterations, avg_times, avg_mems)
+        self._add_colorbar(fig, ax, cmap, norm)
+        return fig, ax, avg_times, legend
 
     # Plotting helper methods (kept small for debugging)
     @staticmethod
+    @functools.lru_cache(maxsize=16)
     def generate_gradient_around_color(center_color, num_steps=10):
         """Create a gradient around the given center color."""
-        center_rgb = mcolors.hex2color(center_color)
-        lighter_colors = [tuple(min(1, c + i * 0.05) for c in center_rgb) for i in range(num_steps)]
-        darker_colors = [tuple(max(0, c - i * 0.05) for c in center_rgb) for i in range(num_steps)]
-        # Combine them to form a full gradient (darker -> center -> lighter)
-        full_gradient = darker_colors[::-1] + [center_rgb] + lighter_colors
-        return full_gradient[::-1]
+        import matplotlib.colors as mcolors
+        center_rgb = np.array(mcolors.hex2color(center_color))
+        # Offsets of the full gradient (lighter -> center -> darker); the first lighter and
+        # darker steps are 0, so the center color appears three times in a row
+        steps = np.arange(num_steps)
+        offsets = np.concatenate((steps[::-1] * 0.05, [0.0], -(steps * 0.05)))
+        full_gradient = np.clip(center_rgb + offsets[:, None], 0.0, 1.0)
+        return tuple(map(tuple, full_gradient.tolist()))
 
     def _setup_figure(self):
         """Initialize figure with original dimensions"""
-        return plt.subplots(figsize=(15.6, 15.6 * 9 / 16))
+        figsize = (15.6, 15.6 * 9 / 16)
+        if self.interactive:
+            import matplotlib.pyplot as plt
+            return plt.subplots(figsize=figsize)
+        # Saving only needs a figure bound to its own Agg canvas: pyplot and the process-wide
+        # backend are left untouched, so no GUI toolkit or display is needed
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        fig = Figure(figsize=figsize)
+        FigureCanvasAgg(fig)
+        return fig, fig.add_subplot()
 
     def _create_bars(self, ax, problems, avg_times, center_color, rel_memory):
-        """Create colored bars"""
+        """Create colored bars; the colormap and norm are returned for the colorbar"""
+        import matplotlib.colors as mcolors
         gradient = self.generate_gradient_around_color(center_color)
         cmap = mcolors.LinearSegmentedColormap.from_list("custom_gradient", gradient)
         norm = mcolors.Normalize(vmin=min(rel_memory), vmax=max(rel_memory))
-        bar_colors = [cmap(norm(p)) for p in rel_memory]
-        return ax.bar(problems, avg_times, color=bar_colors, zorder=3, alpha=0.95)
+        bar_colors = cmap(norm(np.asarray(rel_memory)))
+        bars = ax.bar(problems, avg_times, color=bar_colors, zorder=3, alpha=0.95)
+        return bars, cmap, norm
 
     def _add_annotations(self, ax, bars, df):
         """Add bar annotations"""
+        langs = df['Lang'].to_numpy()
+        sizes = df['Size(kB)'].to_numpy()
+        mems = df['Avg(MB)'].to_numpy()
         for i, bar in enumerate(bars):
             height = bar.get_height()
             ax.annotate(
-                f"({df['Lang'].iloc[i]} | {df['Size(kB)'].iloc[i]:.2f} kB) \n PM = {df['Avg(MB)'].iloc[i]:.1f} MB",
+                f"({langs[i]} | {sizes[i]:.2f} kB) \n PM = {mems[i]:.1f} MB",
                 xy=(bar.get_x() + bar.get_width()/2, height),
                 xytext=(bar.get_x() - 0.3, height * 1.15),
                 arrowprops=dict(facecolor='black', arrowstyle='->'),
                 fontsize=7, color='black', rotation=90, zorder=5
             )
 
-    def _configure_axes(self, ax, problems, avg_times, scale):
+    def _configure_axes(self, ax, problems):
         """Configure axes"""
-        ax.set_yscale(scale)
         ax.set_xticks(problems)
         ax.set_xticklabels([f'{self.problem_title} {int(p)}' for p in problems], rotation=45, ha='right')
-        ax.set_ylabel(f"({scale.capitalize()} Scale) Average Time (ms)", fontsize=14)
         ax.grid(True, which='major', axis='y', linestyle='--', linewidth=0.8, alpha=0.8)
-        ax.minorticks_on()
         ax.grid(True, which='minor', axis='y', linestyle=':', linewidth=0.6, alpha=0.6)
 
+    def _apply_scale(self, ax, scale, avg_times, legend):
+        """Switch the y-axis to the given scale"""
+        ax.set_yscale(scale)
+        # set_yscale installs fresh locators, so minor ticks are turned on again
+        ax.minorticks_on()
+        ax.set_ylabel(f"({scale.capitalize()} Scale) Average Time (ms)", fontsize=14)
+        legend.get_texts()[0].set_text(f"Scale: {scale.capitalize()}")
+
         if scale == 'linear':
             ax.set_ylim(0, max(avg_times) * 1.425)
         else:
@@ -233,6 +294,7 @@ class ResultsProcessor:
 
     def _add_legends(self, ax, challenge, iterations, avg_times, avg_mems):
         """Add complex legend"""
+        from matplotlib.lines import Line2D
         total_time = np.sum(avg_times)
         total_mem = np.sum(avg_mems)
 
@@ -243,10 +305,10 @@ class ResultsProcessor:
 
         # Custom info lines
         custom_lines = [
-            plt.Line2D([0], [0], color='white', label=f"Scale: {ax.get_yscale().capitalize()}"),
-            plt.Line2D([0], [0], color='white', label=f"Iterations: {iterations}"),
-            plt.Line2D([0], [0], color='white', label=f"Peak Memory (PM): {total_mem:.2f} MB"),
-            plt.Line2D([0], [0], color='white', label=f"Avg Run Time: {total_time/1000:.2f} s"),
+            Line2D([0], [0], color='white', label=f"Scale: {ax.get_yscale().capitalize()}"),
+            Line2D([0], [0], color='white', label=f"Iterations: {iterations}"),
+            Line2D([0], [0], color='white', label=f"Peak Memory (PM): {total_mem:.2f} MB"),
+            Line2D([0], [0], color='white', label=f"Avg Run Time: {total_time/1000:.2f} s"),
         ]
 
         # Combined legend
@@ -259,11 +321,10 @@ class ResultsProcessor:
         )
         ax.add_artist(final_legend)
         ax.set_title(f'{challenge}', fontsize=21, fontweight='bold')
+        return final_legend
 
-    def _add_colorbar(self, fig, ax, center_color, rel_memory):
+    def _add_colorbar(self, fig, ax, cmap, norm):
         """Add colorbar"""
-        gradient = self.generate_gradient_around_color(center_color)
-        cmap = mcolors.LinearSegmentedColormap.from_list("custom_gradient", gradient)
-        norm = mcolors.Normalize(vmin=min(rel_memory), vmax=max(rel_memory))
+        from matplotlib.cm import ScalarMappable
         cbar = fig.colorbar(ScalarMappable(norm=norm, cmap=cmap), ax=ax)
         cbar.set_label('Relative Percentage of Total Peak Memory (%)', fontsize=12)
@@ -1,79 +1,302 @@
-import subprocess, time, psutil, platform
+import subprocess, time, psutil, platform, sys, os, threading, hashlib, functools, shutil
+from collections import deque, defaultdict
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Dict, Any
-from ..core.SupportedLangs import Language_Support
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple, Optional, Dict, Any, Deque, Callable, IO
+from ..core.SupportedLangs import Language_Support, LangSpec, _LANG_TABLE, _CACHE_DIR, _command_paths, _check_tool_cmd, _get_tool_path
+
+_SKIP_EXT = frozenset({'.txt', '.png', '.exe'})
+# On Linux RSS can be read straight from /proc/<pid>/statm (field 1, in pages)
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if sys.platform.startswith("linux") else 0
+# ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere
+_MAXRSS_UNIT = 1 if sys.platform == "darwin" else 1024
+
+_STDERR_TAIL_LINES = 200
+# Memory sampling starts at 1 ms so short solutions still get samples, then backs off
+# geometrically to the old 100 ms so long runs are not polled needlessly
+_POLL_START = 0.001
+_POLL_MAX = 0.1
+_POLL_BACKOFF = 1.5
+# workers=None keeps two cores free for the parent and the rest of the machine
+_AUTO_WORKERS = max(1, (os.cpu_count() or 1) - 2)
+# Compiled solutions are built into content-addressed folders here and reused across runs
+_BUILD_CACHE = _CACHE_DIR / "bin"
+# Build folders untouched for this long are removed; a solution still in use is simply rebuilt
+_BUILD_CACHE_MAX_AGE = 30 * 24 * 3600  # seconds
+
+@functools.lru_cache(maxsize=None)
+def _prune_build_cache() -> None:
+    """Delete stale <ext>/<hash> build folders; runs once per process"""
+    cutoff = time.time() - _BUILD_CACHE_MAX_AGE
+    try:
+        with os.scandir(_BUILD_CACHE) as entries:
+            ext_dirs = [entry.path for entry in entries if entry.is_dir()]
+    except OSError:
+        return
+    for ext_dir in ext_dirs:
+        try:
+            with os.scandir(ext_dir) as entries:
+                stale = [entry.path for entry in entries
+                         if entry.is_dir() and entry.stat().st_mtime < cutoff]
+        except OSError:
+            continue
+        for build_dir in stale:
+            shutil.rmtree(build_dir, ignore_errors=True)
+
+@functools.lru_cache(maxsize=1024)
+def _build_digest(path_str: str, mtime_ns: int, compile_cmd: Tuple[str, ...],
+                  tool_check: Tuple[str, ...]) -> str:
+    """Hash of the source bytes, the compile command and the compiler version, once per file version"""
+    digest = hashlib.blake2b(Path(path_str).read_bytes(), digest_size=16)
+    digest.update(repr(compile_cmd).encode())
+    digest.update(_check_tool_cmd(tool_check)[1].encode())
+    return digest.hexdigest()
+
+def _build_dir(file_path: Path, extension: str, spec: LangSpec) -> Path:
+    """Build folder for a compiled script; created by run_script only when it compiles"""
+    digest = _build_digest(str(file_path), file_path.stat().st_mtime_ns, spec.compile, spec.tool_check)
+    return _BUILD_CACHE / extension.lstrip(".") / digest
+
+@functools.lru_cache(maxsize=1024)
+def _file_info(path_str: str, mtime_ns: int) -> Tuple[int, float]:
+    """Line count and size in kB of a solution file, read once per file version"""
+    # Count newline bytes chunk by chunk instead of materialising every line
+    count, last = 0, b"\n"
+    with open(path_str, "rb") as file:
+        size_kb = os.fstat(file.fileno()).st_size / 1024
+        for chunk in iter(lambda: file.read(1 << 20), b""):
+            count += chunk.count(b"\n")
+            last = chunk[-1:]
+    # A final line without a trailing newline still counts
+    return count + (last != b"\n"), size_kb
+
+def _drain(stream: IO[str], sink: Callable[[str], Any]) -> None:
+    """Hand every line of a child pipe to sink until EOF"""
+    with stream:
+        for line in stream:
+            sink(line)
+
+def _is_running(process: subprocess.Popen) -> bool:
+    """process.poll() is None, except that on POSIX an exited child is left unreaped for wait4"""
+    if process.returncode is not None:
+        return False
+    if hasattr(os, "waitid"):
+        return os.waitid(os.P_PID, process.pid, os.WEXITED | os.WNOHANG | os.WNOWAIT) is None
+    return process.poll() is None
+
+def _has_tools(spec: LangSpec) -> bool:
+    """True if every executable named by the compile and run commands is on PATH"""
+    # '{exe}' and other placeholders are the built solution itself, not a tool to look up
+    tools = {cmd[0] for cmd in (spec.compile, spec.run) if cmd and not cmd[0].startswith("{")}
+    return all(_get_tool_path(tool) != "Not found" for tool in tools)
+
+def _is_runnable(file_name: str) -> bool:
+    """Cheap pre-filter so inputs, plots, binaries and 'Alt*' scripts never reach run_script"""
+    if file_name.startswith("Alt"):
+        return False
+    return Path(file_name).suffix.lower() not in _SKIP_EXT
+
 class ScriptRunner:
     """Handles execution of challenge solution scripts and performance measurement"""
     supported_languages = Language_Support.supported_languages
 
     def __init__(self):
-        self.times_taken: Dict[int, List[float]] = {}
+        _prune_build_cache()
+        self.times_taken: Dict[int, List[float]] = defaultdict(list)
         self.file_info: Dict[int, Tuple[str, int, float]] = {}
-        self.peak_memory_usage: Dict[int, List[float]] = {}
+        self.peak_memory_usage: Dict[int, List[float]] = defaultdict(list)
+        # The kernel-tracked peak from wait4 is available on POSIX only
+        self._use_rusage = hasattr(os, "wait4") and resource is not None
+
+    @functools.cached_property
+    def _available_languages(self) -> Tuple[str, ...]:
+        """Supported languages with at least one variant whose tools are all on PATH"""
+        available, missing = [], []
+        for lang in self.supported_languages:
+            spec = _LANG_TABLE[f".{lang}"]
+            variants = (spec,) if spec.cargo is None else (spec, spec.cargo)
+            (available if any(map(_has_tools, variants)) else missing).append(lang)
+        if missing:
+            print(f"Skipping languages with no compiler/interpreter on PATH: {', '.join(missing)}")
+        return tuple(available)
 
     def get_file_line_count(self, file_path: Path) -> int:
         try:
-            with file_path.open("r", encoding="utf-8") as file:
-                return len(file.readlines())
+            return _file_info(str(file_path), file_path.stat().st_mtime_ns)[0]
         except Exception:
             return 0
 
     def get_file_size(self, file_path: Path) -> float:
         try:
-            return file_path.stat().st_size / 1024
+            return _file_info(str(file_path), file_path.stat().st_mtime_ns)[1]
         except Exception:
             return 0.0
 
     def monitor_memory_usage(self, process: subprocess.Popen) -> float:
+        if _PAGE_SIZE:
+            return self._monitor_statm(process)
         try:
-            peak_memory = 0.0
-            while process.poll() is None:
-                mem_info = psutil.Process(process.pid).memory_info()
-                peak_memory = max(peak_memory, mem_info.rss)
-                time.sleep(0.1)
-            return peak_memory / (1024 ** 2)  # MB
+            # One handle for the whole run instead of a new psutil.Process per sample
+            child = psutil.Process(process.pid)
         except (psutil.NoSuchProcess, psutil.AccessDenied):
             return 0.0
+        return self._sample_rss(process, child)
+
+    def _sample_rss(self, process: subprocess.Popen, child: psutil.Process) -> float:
+        """Poll the RSS of an open psutil handle until the process exits, in MB"""
+        peak_memory = 0.0
+        interval = _POLL_START
+        while _is_running(process):
+            try:
+                peak_memory = max(peak_memory, child.memory_info().rss)
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                break
+            time.sleep(interval)
+            interval = min(_POLL_MAX, interval * _POLL_BACKOFF)
+        return peak_memory / (1024 ** 2)  # MB
+
+    def wait_for_peak_memory(self, process: subprocess.Popen) -> float:
+        """Wait for the process to exit and return its peak RSS in MB"""
+        if platform.system() == "Windows":
+            # Open the handle while the child is alive and sample through it; after the wait the
+            # same handle reads the kernel's peak working set, and if psutil refuses the exited
+            # process the sampled peak still stands
+            try:
+                child = psutil.Process(process.pid)
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                process.wait()
+                return 0.0
+            peak_memory = self._sample_rss(process, child)
+            process.wait()
+            try:
+                peak_memory = max(peak_memory, child.memory_info().peak_wset / (1024 ** 2))
+            except (psutil.NoSuchProcess, psutil.AccessDenied, AttributeError):
+                pass
+            return peak_memory
+
+        peak_memory = self.monitor_memory_usage(process)
+        if self._use_rusage and process.returncode is None:
+            # The sampler leaves the child unreaped so wait4 can report the kernel-tracked peak.
+            # A spawned child inherits our own RSS high-water mark, so ru_maxrss is only the
+            # child's real peak when it rises above ours; below that the samples are kept.
+            _, status, rusage = os.wait4(process.pid, 0)
+            process.returncode = os.waitstatus_to_exitcode(status)
+            if rusage.ru_maxrss > resource.getrusage(resource.RUSAGE_SELF).ru_maxrss:
+                peak_memory = max(peak_memory, rusage.ru_maxrss * _MAXRSS_UNIT / (1024 ** 2))
+        process.wait()
+        return peak_memory
+
+    def _monitor_statm(self, process: subprocess.Popen) -> float:
+        """Linux fast path: re-read /proc/<pid>/statm through one open descriptor"""
+        try:
+            statm_fd = os.open(f"/proc/{process.pid}/statm", os.O_RDONLY)
+        except OSError:
+            return 0.0
+        try:
+            peak_pages = 0
+            interval = _POLL_START
+            while _is_running(process):
+                try:
+                    peak_pages = max(peak_pages, int(os.pread(statm_fd, 128, 0).split()[1]))
+                except (OSError, IndexError, ValueError):
+                    break
+                time.sleep(interval)
+                interval = min(_POLL_MAX, interval * _POLL_BACKOFF)
+            return peak_pages * _PAGE_SIZE / (1024 ** 2)  # MB
+        finally:
+            os.close(statm_fd)
+
+    @staticmethod
+    def _is_up_to_date(source: Path, artifacts: List[str]) -> bool:
+        """True if every build artifact exists and is newer than the source file"""
+        if not artifacts:
+            return False
+        try:
+            source_mtime = source.stat().st_mtime_ns
+            return all(Path(a).stat().st_mtime_ns > source_mtime for a in artifacts)
+        except OSError:
+            return False
 
     def _record_result(self, problem_number: int, result: Tuple[str, int, float, float, float]):
         ext, lines, size, time_ms, memory = result
-        if problem_number not in self.times_taken:
-            self.times_taken[problem_number] = []
-            self.peak_memory_usage[problem_number] = []
-            self.file_info[problem_number] = (
-                f"{ext}", lines, size
-            )
         self.times_taken[problem_number].append(time_ms)
         self.peak_memory_usage[problem_number].append(memory)
+        # The first recorded script of a problem describes it, as before
+        self.file_info.setdefault(problem_number, (ext, lines, size))
+
+    def _discover_scripts(self, base_dir: Path, problems_to_run: List[int],
+                          config: object) -> List[Tuple[int, Path, Path]]:
+        """List (problem_no, solution_file, input_path) for every runnable solution"""
+        text_input_tpl = config.get_property("text_input")
+        tasks: List[Tuple[int, Path, Path]] = []
+        for problem_no in problems_to_run:
+            problem_folder = config.get_problem_folder(problem_no)
+            problem_path = base_dir / problem_folder
+            # A missing problem folder is skipped once instead of globbed per language
+            if not problem_path.is_dir():
+                continue
+            input_path = problem_path / f"{text_input_tpl.format(problem_no=problem_no)}.txt"
+            for lang in self._available_languages:
+                solution_pattern = config.get_solution_filename(problem_no, lang)
+                for solution_file in problem_path.glob(solution_pattern):
+                    if not _is_runnable(solution_file.name):
+                        continue
+                    # The variant actually used (e.g. cargo next to a Cargo.toml) decides the tools
+                    spec = _LANG_TABLE.get(solution_file.suffix.lower())
+                    if spec is not None and not _has_tools(spec.for_source(solution_file)):
+                        print(f"Skipping script: {solution_file.name} (compiler/interpreter not on PATH)")
+                        continue
+                    tasks.append((problem_no, solution_file, input_path))
+        return tasks
 
     def process_directory(self, base_dir: Path, problems_to_run: List[int],
-                        iterations: int, config: object):
+                        iterations: int, config: object, workers: Optional[int] = 1,
+                        serial_memory: bool = False):
+        """Run every solution script found for the given problems.
+
+        With workers > 1 the scripts of an iteration run concurrently; this is faster
+        but the scripts then compete for CPU and memory, which skews the measurements.
+        workers=None sizes the pool to the cpu count minus two, and serial_memory
+        forces one script at a time when the peak memory figures must be accurate.
+        """
+        if workers is None:
+            workers = _AUTO_WORKERS
+        if serial_memory:
+            workers = 1
+        # The solution files do not change between iterations, so the folders are walked once
+        tasks = self._discover_scripts(base_dir, problems_to_run, config)
         for iteration in range(iterations):
             print(f"\nIteration run: {iteration + 1}/{iterations}\n")
-            for problem_no in problems_to_run:
-                problem_folder = config.get_problem_folder(problem_no)
-                problem_path = base_dir / problem_folder
-                for lang in self.supported_languages:
-                    solution_pattern = config.get_solution_filename(problem_no, lang)
-                    text_input = config.get_property("text_input").format(problem_no=problem_no)
-                    input_path = problem_path / f"{text_input}.txt"
-                    for solution_file in problem_path.glob(solution_pattern):
-                        result = self.run_script(solution_file, input_path)
-                        if result:
-                            self._record_result(problem_no, result)
+            if workers > 1:
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    results = list(pool.map(
+                        lambda task: self.run_script(task[1], task[2], cleanup=False), tasks))
+            else:
+                results = (self.run_script(solution_file, input_path, cleanup=False)
+                           for _, solution_file, input_path in tasks)
+
+            for (problem_no, _, _), result in zip(tasks, results):
+                if result:
+                    self._record_result(problem_no, result)
 
     def run_script(
         self,
         file_path: Path,
         input_file: Optional[Path] = None,
-        cleanup: bool = True
+        cleanup: bool = False,
+        capture_output: bool = False
     ) -> Optional[Tuple[str, int, float, float, float]]:
         extension = file_path.suffix.lower()
         file_name = file_path.name
 
         # Early skip conditions
-        if extension in {'.txt', '.png', '.exe'} or file_name.startswith("Alt"):
-            reason = " (unsupported extension)" if extension in {'.txt', '.png', '.exe'} else " (starts with 'Alt')"
+        skip_ext = extension in _SKIP_EXT
+        if skip_ext or file_name.startswith("Alt"):
+            reason = " (unsupported extension)" if skip_ext else " (starts with 'Alt')"
             print(f"Skipping script: {file_name}{reason}")
             return None
 
@@ -83,25 +306,30 @@ class ScriptRunner:
         input_method = "arg" if input_file else "none"
 
         # Language config
-        language_config = Language_Support(file_path, exe_path, input_method).language_config
-        if extension not in language_config:
+        spec = _LANG_TABLE.get(extension)
+        if spec is None:
             print(f"Unsupported file type for {file_name}. Skipping.")
             return None
 
-        config = language_config[extension]
-        cleanup_files: list[str] = []
+        spec = spec.for_source(file_path)
+        input_method = spec.input_method or input_method
+        cleanup_dir: Optional[Path] = None
 
         print(f"Running script: {file_name}")
-        start_time = time.time()
         process: Optional[subprocess.Popen] = None
 
         try:
             # --- Compilation (if needed) ---
-            compile_cmd = config.get("compile")
-            if callable(compile_cmd):
-                compile_cmd = compile_cmd(file_path, exe_path)
+            if spec.compile:
+                # An unchanged source maps to the same build folder, so it is only ever compiled once
+                exe_path = _build_dir(file_path, extension, spec) / f"{file_path.stem}{exe_suffix}"
+            # Every command of this script is filled from the same precomputed path strings
+            paths = _command_paths(file_path, exe_path)
+            compile_cmd = spec.build_compile(paths)
+            artifacts = spec.build_cleanup(paths)
 
-            if compile_cmd:
+            if compile_cmd and not self._is_up_to_date(file_path, artifacts):
+                exe_path.parent.mkdir(parents=True, exist_ok=True)
                 try:
                     subprocess.run(
                         compile_cmd,
@@ -110,59 +338,69 @@ class ScriptRunner:
                         stderr=subprocess.PIPE,
                         text=True,
                     )
-                    cleanup_val = config.get("cleanup")
-                    if cleanup and cleanup_val:
-                        cleanup_files.extend(
-                            cleanup_val(file_path, exe_path) if callable(cleanup_val) else cleanup_val
-                        )
                 except subprocess.CalledProcessError as e:
                     print(f"Compilation failed for {file_name}:\n{e.stderr}")
                     return None
+            if compile_cmd and cleanup:
+                # The artifacts live in the shared build cache, so cleanup drops the whole folder
+                cleanup_dir = exe_path.parent
 
             # --- Prepare execution ---
-            run_cmd = config["run"]
-            if callable(run_cmd):
-                run_cmd = run_cmd(file_path, exe_path)
+            run_cmd = spec.build_run(paths)
 
-            if input_file and config.get("input_method") == "arg":
+            if input_file and input_method == "arg":
                 run_cmd.append(str(input_file))
 
+            env = {**os.environ, **dict(spec.env)} if spec.env else None
+
+            # Input goes through argv unless the language reads it from stdin; in that case the
+            # child gets no terminal stdin, so a stray read returns EOF instead of blocking
             stdin_source = None
-            if input_file and config.get("input_method") != "arg":
-                stdin_source = open(input_file, "r")
+            if input_file and input_method != "arg":
+                stdin_source = open(input_file, "rb")
 
+            start_ns = time.perf_counter_ns()
             try:
+                # Solution output is only piped through when asked for; otherwise it is discarded
                 process = subprocess.Popen(
                     run_cmd,
-                    stdin=stdin_source,
-                    stdout=subprocess.PIPE,
+                    stdin=stdin_source or subprocess.DEVNULL,
+                    stdout=subprocess.PIPE if capture_output else subprocess.DEVNULL,
                     stderr=subprocess.PIPE,
                     text=True,
+                    env=env,
                 )
             finally:
                 if stdin_source:
                     stdin_source.close()
 
-            # --- Monitor & collect output ---
-            peak_memory = self.monitor_memory_usage(process)
-            stdout, stderr = process.communicate()
+            # --- Monitor & stream output ---
+            # Pipes are drained as the child writes so it never blocks on a full pipe;
+            # stdout is forwarded live and only the tail of stderr is kept for error reports
+            stderr_tail: Deque[str] = deque(maxlen=_STDERR_TAIL_LINES)
+            readers = [threading.Thread(target=_drain, args=(process.stderr, stderr_tail.append), daemon=True)]
+            if capture_output:
+                readers.append(threading.Thread(target=_drain, args=(process.stdout, sys.stdout.write), daemon=True))
+            for reader in readers:
+                reader.start()
+
+            peak_memory = self.wait_for_peak_memory(process)
+            for reader in readers:
+                reader.join()
 
             if process.returncode != 0:
                 print(f"Execution failed for {file_name} (exit code {process.returncode}):")
-                if stderr:
-                    print(stderr)
+                if stderr_tail:
+                    print("".join(stderr_tail))
                 return None
 
-            if stdout:
-                print(stdout)
-
-            return (
-                extension,
-                self.get_file_line_count(file_path),
-                self.get_file_size(file_path),
-                (time.time() - start_time) * 1000,  # ms
-                peak_memory,
-            )
+            elapsed_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+            try:
+                # Sources do not change between iterations, so this is only read on the first run
+                lines, size_kb = _file_info(str(file_path), file_path.stat().st_mtime_ns)
+            except OSError:
+                lines, size_kb = 0, 0.0
+            return (extension, lines, size_kb, elapsed_ms, peak_memory)
 
         except FileNotFoundError as e:
             print(f"Required interpreter/compiler not found for {file_name}: {e}\n")
@@ -179,9 +417,9 @@ class ScriptRunner:
                 except subprocess.TimeoutExpired:
                     process.kill()
 
-            # Remove intermediate files
-            for f in cleanup_files:
+            # Remove the build folder when asked to
+            if cleanup_dir is not None:
                 try:
-                    Path(f).unlink(missing_ok=True)
+                    shutil.rmtree(cleanup_dir)
                 except OSError as e:
-                    print(f"Warning: Could not remove {f}: {e}\n")
+                    print(f"Warning: Could not remove {cleanup_dir}: {e}\n")
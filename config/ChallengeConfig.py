@@ -1,7 +1,29 @@
+import copy
 import json
+import functools
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Dict, Any
 
+try:
+    # Optional C parser; orjson.JSONDecodeError subclasses json.JSONDecodeError
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+@functools.lru_cache(maxsize=32)
+def _load_json(path_str: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a JSON config file; keyed on mtime so an edited file is parsed again."""
+    return _json_loads(Path(path_str).read_bytes())
+
+def _read_config(config_path: Path) -> Dict[str, Any]:
+    """Return a private copy of the cached config so callers may mutate it freely."""
+    return copy.deepcopy(_load_json(str(config_path), config_path.stat().st_mtime_ns))
+
+@functools.lru_cache(maxsize=256)
+def _format_pattern(pattern: str, **fields: Any) -> str:
+    """Fill a name pattern; the same problem/language names are requested on every iteration."""
+    return pattern.format(**fields)
+
 class ChallengeConfig:
 
     def __init__(self, config_path: Optional[Path] = None, config_file:str = "challenge.json"):
@@ -24,8 +46,7 @@ class ChallengeConfig:
                 config_path = config_path / config_file
             if config_path.is_file():
                 try:
-                    with config_path.open("r", encoding="utf-8") as f:
-                        return json.load(f)
+                    return _read_config(config_path)
                 except (PermissionError, json.JSONDecodeError, UnicodeDecodeError) as e:
                     raise RuntimeError(f"Failed to load user config: {type(e).__name__} - {e}")
 
@@ -33,8 +54,7 @@ class ChallengeConfig:
         if not default_config_path.is_file():
             raise FileNotFoundError(f"Default config file not found: {default_config_path}")
         try:
-            with default_config_path.open("r", encoding="utf-8") as f:
-                return json.load(f)
+            return _read_config(default_config_path)
         except (PermissionError, json.JSONDecodeError, UnicodeDecodeError) as e:
             raise RuntimeError(f"Failed to load default config: {type(e).__name__} - {e}")
 
@@ -54,11 +74,12 @@ class ChallengeConfig:
 
     def get_problem_folder(self, problem_no: int) -> str:
         """Generate problem folder name from pattern"""
-        return self.config_data['problem_folder'].format(problem_no=problem_no)
+        return _format_pattern(self.config_data['problem_folder'], problem_no=problem_no)
 
     def get_solution_filename(self, problem_no: int, lang: str) -> str:
         """Generate solution filename from pattern"""
-        return self.config_data['solution_file'].format(
+        return _format_pattern(
+            self.config_data['solution_file'],
             challenge_folder=self.config_data['challenge_folder'],
             problem_no=problem_no,
             lang=lang
@@ -1,5 +1,6 @@
 import sys
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple, Optional, Dict, Any
 # Get the absolute path to the parent directory containing challenge_utils
 current_dir = str(Path(__file__).parent)
@@ -13,21 +14,25 @@ from ..benchmarks.ResultsProcessor import ResultsProcessor
 
 class ChallengeBenchmarks:
     """Main class that coordinates the performance analysis workflow"""
-    def __init__(self, base_dir: Path, config_file: str = ""):
+    def __init__(self, base_dir: Path, config_file: str = "", interactive: bool = False):
         self.base_dir = base_dir
         self.config = ChallengeConfig(base_dir, config_file)
         self.plot_color = self.config.get_property("plot_color")
         self.challenge_id = self.config.get_property("challenge_id")
         self.challenge_header = self.config.get_property("challenge_header")
         self.script_runner = ScriptRunner()
-        self.visualizer = ResultsProcessor(self.challenge_id, self.config.get_property("problem_title"))
+        # interactive=True shows the plots in a window; otherwise they are only saved
+        self.visualizer = ResultsProcessor(self.challenge_id, self.config.get_property("problem_title"),
+                                           interactive)
 
     def analyze(self, problems_to_run: List[int], iterations: int = 5, save_results: bool = True,
-                custom_dir: Optional[Path] = None):
+                custom_dir: Optional[Path] = None, workers: Optional[int] = 1,
+                serial_memory: bool = False):
         print(f"\n{self.challenge_header}")
         print(f"Analyzing problems {min(problems_to_run)} to {max(problems_to_run)} over {iterations} iterations")
 
-        self.script_runner.process_directory(self.base_dir, problems_to_run, iterations, self.config)
+        self.script_runner.process_directory(self.base_dir, problems_to_run, iterations,
+                                              self.config, workers, serial_memory)
 
         df = self.visualizer.generate_table(
             self.script_runner.file_info,
@@ -40,10 +45,13 @@ class ChallengeBenchmarks:
         if save_results:
             save_dir = custom_dir if custom_dir else self.base_dir
             save_dir.mkdir(exist_ok=True)
-            self.visualizer.generate_plot(df, self.challenge_header, iterations,
-                                            save_dir, self.plot_color, 'linear')
-            self.visualizer.generate_plot(df, self.challenge_header, iterations,
-                                            save_dir, self.plot_color, 'log')
-            self.visualizer.save_table(save_dir)
+            # One writer thread does the disk writes while the plots are still being drawn
+            with ThreadPoolExecutor(max_workers=1) as writer:
+                writes = [writer.submit(self.visualizer.save_table, save_dir)]
+                writes += self.visualizer.generate_plots(df, self.challenge_header, iterations,
+                                                         save_dir, self.plot_color, ('linear', 'log'),
+                                                         writer)
+            for write in writes:
+                write.result()  # re-raise any write error here
         return df
 
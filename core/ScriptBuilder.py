@@ -1,9 +1,16 @@
-import sys, os, time
+import sys, os, time, functools
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Set, Tuple
 from ..core.SupportedLangs import Language_Support
 from ..config.ChallengeConfig import ChallengeConfig
 
+_TEMPLATE_DIR = Path(__file__).resolve().parent.parent / "templates"
+
+@functools.lru_cache(maxsize=32)
+def _load_template(name: str) -> str:
+    """Read a bundled template once; they ship with the package and do not change at runtime."""
+    return (_TEMPLATE_DIR / name).read_text(encoding="utf-8")
+
 class ScriptBuilder:
     TEMPLATE_PATHS = Language_Support.TEMPLATE_PATHS
 
@@ -21,29 +28,36 @@ class ScriptBuilder:
         relative_path = path.relative_to(self.challenge_dir)
         print(f"[{message}] {relative_path}")
 
+    @functools.cached_property
+    def _header_fields(self) -> Tuple[str, Dict[str, Any]]:
+        """Header template and the fields that stay the same for every problem of this builder."""
+        return self.config.get_property("script_header"), {
+            "author": self.author,
+            "id": self.config.get_property("challenge_id"),
+        }
+
     def _generate_header(self, prob_no: int) -> str:
         current_time = time.localtime()
-        header_template = self.config.get_property("script_header")
+        header_template, fixed_fields = self._header_fields
         context = {
-            "author": self.author,
+            **fixed_fields,
             "problem_no": prob_no,
-            "id": self.config.get_property("challenge_id"),
             "current_time": current_time,
             "month": time.strftime("%B", current_time),
         }
-        return header_template.format(**context)
+        return header_template.format_map(context)
 
     def _create_problem_folder(self, prob_no: int) -> Path:
         formatted_prob = self.config.get_problem_folder(prob_no)
         problem_dir = self.challenge_dir / formatted_prob
-        if not problem_dir.exists():
-            problem_dir.mkdir(parents=True, exist_ok=True)
+        try:
+            problem_dir.mkdir(parents=True)
             self._log(problem_dir, "Folder Created")
-        else:
+        except FileExistsError:
             self._log(problem_dir, "Folder Exists")
         return problem_dir
 
-    def _create_text_files(self, prob_no: int, txt_files: int) -> str:
+    def _create_text_files(self, prob_no: int, txt_files: int, existing: Set[str]) -> str:
         base_name = self.config.get_property("text_input").format(problem_no=prob_no)
         selected_file = None
         count = max(1, txt_files)
@@ -53,11 +67,15 @@ class ScriptBuilder:
             file_name = f"{base_name}{suffix}.txt"
             file_path = self.problem_dir / file_name
 
-            if not file_path.exists():
-                file_path.write_text("", encoding="utf-8")
-                self._log(file_path, "Text File Created")
-            else:
+            if file_name in existing:
                 self._log(file_path, "Text File Exists")
+            else:
+                # Exclusive create, in case the file appeared after the folder was listed
+                try:
+                    file_path.touch(exist_ok=False)
+                    self._log(file_path, "Text File Created")
+                except FileExistsError:
+                    self._log(file_path, "Text File Exists")
 
             if selected_file is None:
                 selected_file = file_name
@@ -67,8 +85,7 @@ class ScriptBuilder:
     def _script_properties(self, prob_no: int, language: str, text_file: str):
         script_template, ext = self.TEMPLATE_PATHS.get(language.lower(), ("", "txt"))
         file_name = self.config.get_solution_filename(prob_no, ext)
-        template_path = Path("challenge_utils/templates") / script_template
-        template_content = template_path.read_text(encoding="utf-8")
+        template_content = _load_template(script_template)
 
         header = self._generate_header(prob_no)
         filled_content = template_content.format(
@@ -83,10 +100,13 @@ class ScriptBuilder:
             raise ValueError(f"No template for language: {language}")
 
         self.problem_dir = self._create_problem_folder(prob_no)
-        sel_txt_file = self._create_text_files(prob_no, txt_files)
+        # One directory listing answers every existence check for this problem
+        with os.scandir(self.problem_dir) as entries:
+            existing = {entry.name for entry in entries}
+        sel_txt_file = self._create_text_files(prob_no, txt_files, existing)
 
         script_content, file_path = self._script_properties(prob_no, language, sel_txt_file)
-        if file_path.exists():
+        if file_path.name in existing:
             self._log(file_path, "Script Skipped")
             return file_path
 
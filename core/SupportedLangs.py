@@ -1,9 +1,161 @@
 import time
+import shutil
+import functools
 import subprocess
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Any, Set
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple, Optional, Any, Set, Mapping
 import os
 
+# Per-user cache for build outputs and bytecode, shared by every run
+_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "challenge_utils"
+
+@dataclass(frozen=True, slots=True)
+class LangSpec:
+    """How one language is built, run and version-checked"""
+    run: Tuple[str, ...]
+    tool_check: Tuple[str, ...]
+    compile: Optional[Tuple[str, ...]] = None
+    cleanup: Tuple[str, ...] = ()
+    input_method: Optional[str] = None  # None: use the one chosen by the caller
+    cargo: Optional["LangSpec"] = None  # Used instead when a Cargo.toml sits next to the source
+    env: Tuple[Tuple[str, str], ...] = ()  # Extra environment variables for the run command
+
+    def for_source(self, file_path: Path) -> "LangSpec":
+        """Pick the variant of this spec that applies to a concrete script"""
+        if self.cargo is not None and (file_path.parent / "Cargo.toml").exists():
+            return self.cargo
+        return self
+
+    def build_run(self, paths: Mapping[str, str]) -> List[str]:
+        """Run command for the script described by paths (see _command_paths)"""
+        return [part.format_map(paths) for part in self.run]
+
+    def build_compile(self, paths: Mapping[str, str]) -> Optional[List[str]]:
+        """Compile command for the script, or None for interpreted languages"""
+        return [part.format_map(paths) for part in self.compile] if self.compile else None
+
+    def build_cleanup(self, paths: Mapping[str, str]) -> List[str]:
+        """Build artifacts the script leaves behind"""
+        return [part.format_map(paths) for part in self.cleanup]
+
+# Command templates for every known extension, shared by Language_Support and ScriptRunner.
+# '{file}', '{exe}', '{dir}', '{stem}', '{build}' (the folder holding the executable) and
+# '{classfile}' are filled in per script from the _command_paths mapping.
+_LANG_TABLE: Dict[str, LangSpec] = {
+    # Interpreted languages (direct execution)
+    '.py': LangSpec(
+        run=('python', '{file}'), tool_check=('python', '--version'),
+        # Every run starts a fresh interpreter on purpose: solutions are plain scripts run as
+        # __main__, and each language is timed including its own process start-up.
+        # Imported helper modules reuse bytecode kept in the cache instead of recompiling
+        # or littering solution folders; no user-site scan; reproducible str hashing
+        env=(('PYTHONPYCACHEPREFIX', str(_CACHE_DIR / "pycache")), ('PYTHONNOUSERSITE', '1'), ('PYTHONHASHSEED', '0')),
+    ),
+    '.rb': LangSpec(run=('ruby', '{file}'), tool_check=('ruby', '--version')),
+    '.jl': LangSpec(run=('julia', '--startup-file=no', '{file}'), tool_check=('julia', '--version')),
+    '.js': LangSpec(run=('node', '{file}'), tool_check=('node', '--version')),
+    '.ts': LangSpec(run=('ts-node', '{file}'), tool_check=('ts-node', '--version')),
+    '.pl': LangSpec(run=('perl', '{file}'), tool_check=('perl', '--version')),
+    '.php': LangSpec(run=('php', '{file}'), tool_check=('php', '--version')),
+    '.lua': LangSpec(run=('lua', '{file}'), tool_check=('lua', '-v')),
+    '.r': LangSpec(run=('Rscript', '{file}'), tool_check=('Rscript', '--version')),
+    '.sh': LangSpec(run=('bash', '{file}'), tool_check=('bash', '--version')),
+    '.ps1': LangSpec(run=('pwsh', '-File', '{file}'), tool_check=('pwsh', '--version')),
+    '.go': LangSpec(run=('go', 'run', '{file}'), tool_check=('go', 'version')),
+
+    # Compiled languages (require compilation step)
+    '.c': LangSpec(
+        compile=('gcc', '-O2', '{file}', '-o', '{exe}'),
+        run=('{exe}',),
+        cleanup=('{exe}',),
+        tool_check=('gcc', '--version'),
+    ),
+    '.cpp': LangSpec(
+        compile=('g++', '-O2', '{file}', '-o', '{exe}'),
+        run=('{exe}',),
+        input_method='arg',
+        cleanup=('{exe}',),
+        tool_check=('g++', '--version'),
+    ),
+    '.java': LangSpec(
+        compile=('javac', '-d', '{build}', '{file}'),
+        # Short-lived solutions never reach C2, so stop at C1 and skip the parallel GC's startup
+        run=('java', '-XX:TieredStopAtLevel=1', '-XX:+UseSerialGC', '-cp', '{build}', '{stem}'),
+        input_method='arg',
+        cleanup=('{classfile}',),
+        tool_check=('javac', '-version'),
+    ),
+    '.rs': LangSpec(
+        compile=('rustc', '--edition=2021', '{file}', '-o', '{exe}'),
+        run=('{exe}',),
+        input_method='arg',
+        cleanup=('{exe}',),
+        tool_check=('rustc', '--version'),
+        cargo=LangSpec(
+            run=('cargo', 'run', '--quiet', '--bin', '{stem}'),
+            input_method='arg',
+            tool_check=('cargo', '--version'),
+        ),
+    ),
+
+    # Other languages
+    '.scala': LangSpec(run=('scala', '{file}'), tool_check=('scala', '-version')),
+    '.swift': LangSpec(run=('swift', '{file}'), tool_check=('swift', '--version')),
+    '.kt': LangSpec(run=('kotlin', '{file}'), tool_check=('kotlin', '-version')),
+    '.hs': LangSpec(run=('runhaskell', '{file}'), tool_check=('ghc', '--version')),
+    '.ml': LangSpec(run=('ocaml', '{file}'), tool_check=('ocaml', '--version')),
+    '.clj': LangSpec(run=('clojure', '{file}'), tool_check=('clojure', '--version')),
+}
+
+def _command_paths(file_path: Path, exe_path: Path) -> Dict[str, str]:
+    """Placeholder values for one script, computed once and shared by all of its commands"""
+    stem, build = file_path.stem, exe_path.parent
+    return {
+        'file': str(file_path),
+        'exe': str(exe_path),
+        'dir': str(file_path.parent),
+        'stem': stem,
+        'build': str(build),
+        'classfile': str(build / f"{stem}.class"),
+    }
+
+# Tool availability does not change during a run, so lookups are memoized;
+# Language_Support.invalidate_tool_cache() clears them.
+@functools.lru_cache(maxsize=64)
+def _get_tool_path(command_name: str) -> str:
+    """Get the full path to a command executable"""
+    return shutil.which(command_name) or "Not found"
+
+@functools.lru_cache(maxsize=64)
+def _check_tool_cmd(cmd: Tuple[str, ...]) -> Tuple[str, str, str]:
+    """Run a tool's version command and return (status, version, path)"""
+    tool_path = _get_tool_path(cmd[0])
+    if tool_path == "Not found":
+        # Nothing on PATH to run, so don't spawn the version probe at all
+        return "[NO]", "Not found", tool_path
+
+    try:
+        # Check version
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
+        if result.returncode == 0:
+            version = result.stdout.strip() or result.stderr.strip()
+            status = "[OK]"
+            status_text = version.split('\n')[0]  # Take first line only
+        else:
+            status = "[NO]"
+            status_text = "Not available"
+
+        return status, status_text, tool_path
+
+    except FileNotFoundError:
+        return "[NO]", "Not found", tool_path
+    except subprocess.TimeoutExpired:
+        return "[TO]", "Timeout checking version", tool_path
+    except Exception as e:
+        return "[ERR]", f"Error: {str(e)}", tool_path
+
 class Language_Support:
     """A class to manage supported programming languages and their execution configurations."""
 
@@ -19,7 +171,6 @@ class Language_Support:
         self.file_path = file_path
         self.exe_path = exe_path
         self.input_method = input_method
-        self._initialize_language_config()
 
     @property
     def supported_languages(self) -> List[str]:
@@ -29,7 +180,7 @@ class Language_Support:
     @property
     def all_languages(self) -> List[str]:
         """Return list of all available language extensions."""
-        return list(self.language_config.keys())
+        return list(_LANG_TABLE)
 
     @property
     def TEMPLATE_PATHS(self) -> Dict[str, Tuple[str, str]]:
@@ -48,169 +199,28 @@ class Language_Support:
             "haskell": ("haskell_template.hs", "hs"),
         }
 
-    def _initialize_language_config(self) -> None:
-        """Initialize the language configuration dictionary."""
-        # Use dummy paths for initialization to avoid empty path errors
-        dummy_file = Path(self.file_path)
-        dummy_exe = Path(self.exe_path)
-
-        self.language_config = {
-            # Interpreted languages (direct execution)
-            '.py': {
-                'run': ['python', str(dummy_file)],
-                'input_method': self.input_method,
-                'tool_check': ['python', '--version']
-            },
-            '.rb': {
-                'run': ['ruby', str(dummy_file)],
-                'input_method': self.input_method,
-                'tool_check': ['ruby', '--version']
-            },
-            '.jl': {
-                'run': ['julia', str(dummy_file)],
-                'input_method': self.input_method,
-                'tool_check': ['julia', '--version']
-            },
-            '.js': {
-                'run': ['node', str(dummy_file)],
-                'input_method': self.input_method,
-                'tool_check': ['node', '--version']
-            },
-            '.ts': {
-                'run': ['ts-node', str(dummy_file)],
-                'input_method': self.input_method,
-                'tool_check': ['ts-node', '--version']
-            },
-            '.pl': {
-                'run': ['perl', str(dummy_file)],
-                'input_method': self.input_method,
-                'tool_check': ['perl', '--version']
-            },
-            '.php': {
-                'run': ['php', str(dummy_file)],
-                'input_method': self.input_method,
-                'tool_check': ['php', '--version']
-            },
-            '.lua': {
-                'run': ['lua', str(dummy_file)],
-                'input_method': self.input_method,
-                'tool_check': ['lua', '-v']
-            },
-            '.r': {
-                'run': ['Rscript', str(dummy_file)],
-                'input_method': self.input_method,
-                'tool_check': ['Rscript', '--version']
-            },
-            '.sh': {
-                'run': ['bash', str(dummy_file)],
-                'input_method': self.input_method,
-                'tool_check': ['bash', '--version']
-            },
-            '.ps1': {
-                'run': ['pwsh', '-File', str(dummy_file)],
-                'input_method': self.input_method,
-                'tool_check': ['pwsh', '--version']
-            },
-            '.go': {
-                'run': ['go', 'run', str(dummy_file)],
-                'input_method': self.input_method,
-                'tool_check': ['go', 'version']
-            },
-
-            # Compiled languages (require compilation step)
-            '.c': {
-                'compile': ['gcc', str(dummy_file), '-o', str(dummy_exe)],
-                'run': [str(dummy_exe)],
-                'input_method': self.input_method,
-                'cleanup': [str(dummy_exe)],
-                'tool_check': ['gcc', '--version']
-            },
-            '.cpp': {
-                'compile': ['g++', str(dummy_file), '-o', str(dummy_exe)],
-                'run': [str(dummy_exe)],
-                'input_method': 'arg',
-                'cleanup': [str(dummy_exe)],
-                'tool_check': ['g++', '--version']
-            },
-            '.java': {
-                'compile': ['javac', str(dummy_file)],
-                'run': ['java', '-cp', str(dummy_file.parent), dummy_file.stem],
-                'input_method': 'arg',
-                'cleanup': [str(dummy_file.with_suffix('.class'))],
-                'tool_check': ['javac', '-version']
-            },
-            '.rs': {
-                'compile': lambda file_path, exe_path: (
-                    None if (file_path.parent / "Cargo.toml").exists()
-                    else ['rustc', str(file_path), '-o', str(exe_path)]
-                ),
-                'run': lambda file_path, exe_path: (
-                    ['cargo', 'run', '--quiet', '--bin', file_path.stem]
-                    if (file_path.parent / "Cargo.toml").exists()
-                    else [str(exe_path)]
-                ),
-                'input_method': 'arg',
-                'cleanup': lambda file_path, exe_path: (
-                    [] if (file_path.parent / "Cargo.toml").exists()
-                    else [str(exe_path)]
-                ),
-                'tool_check': lambda file_path: (
-                    ['cargo', '--version']
-                    if (file_path.parent / "Cargo.toml").exists()
-                    else ['rustc', '--version']
-                )
-            },
-
-            # Other languages
-            '.scala': {
-                'run': ['scala', str(dummy_file)],
-                'input_method': self.input_method,
-                'tool_check': ['scala', '-version']
-            },
-            '.swift': {
-                'run': ['swift', str(dummy_file)],
-                'input_method': self.input_method,
-                'tool_check': ['swift', '--version']
-            },
-            '.kt': {
-                'run': ['kotlin', str(dummy_file)],
-                'input_method': self.input_method,
-                'tool_check': ['kotlin', '-version']
-            },
-            '.hs': {
-                'run': ['runhaskell', str(dummy_file)],
-                'input_method': self.input_method,
-                'tool_check': ['ghc', '--version']
-            },
-            '.ml': {
-                'run': ['ocaml', str(dummy_file)],
-                'input_method': self.input_method,
-                'tool_check': ['ocaml', '--version']
-            },
-            '.clj': {
-                'run': ['clojure', str(dummy_file)],
-                'input_method': self.input_method,
-                'tool_check': ['clojure', '--version']
-            },
-        }
+    @functools.cached_property
+    def language_config(self) -> Dict[str, Dict[str, Any]]:
+        """Per-extension commands expanded for this instance's paths, built on first use."""
+        file_path = Path(self.file_path)
+        paths = _command_paths(file_path, Path(self.exe_path))
+
+        language_config = {}
+        for ext, spec in _LANG_TABLE.items():
+            spec = spec.for_source(file_path)
+            entry = {'run': spec.build_run(paths)}
+            if spec.compile:
+                entry['compile'] = spec.build_compile(paths)
+            if spec.cleanup:
+                entry['cleanup'] = spec.build_cleanup(paths)
+            entry['tool_check'] = list(spec.tool_check)
+            entry['input_method'] = spec.input_method if spec.input_method is not None else self.input_method
+            language_config[ext] = entry
+        return language_config
 
     def get_tool_path(self, command_name: str) -> str:
         """Get the full path to a command executable"""
-        try:
-            # Try 'where' command (Windows)
-            if os.name == 'nt':
-                result = subprocess.run(['where', command_name], capture_output=True, text=True, timeout=5)
-            else:
-                # Try 'which' command (Unix/Linux/Mac)
-                result = subprocess.run(['which', command_name], capture_output=True, text=True, timeout=5)
-            if result.returncode == 0:
-                paths = result.stdout.strip().split('\n')
-                return paths[0] if paths else "Not found"
-            return "Not found"
-        except subprocess.TimeoutExpired:
-            return "Timeout finding path"
-        except Exception:
-            return "Error finding path"
+        return _get_tool_path(command_name)
 
     def check_tool(self, language_ext: str, check_all: bool = False) -> Tuple[str, str, str]:
         """
@@ -225,38 +235,21 @@ class Language_Support:
         if not check_all and language_ext[1:] not in self.supported_languages:
             return "[SKIP]", "Skipped (not supported)", "N/A"
 
-        if language_ext not in self.language_config:
+        spec = _LANG_TABLE.get(language_ext)
+        if spec is None:
             return "[UNK]", "Unknown language", "N/A"
 
-        config = self.language_config[language_ext]
-        if 'tool_check' not in config:
+        spec = spec.for_source(Path(self.file_path))
+        if not spec.tool_check:
             return "[N/A]", "No tool check configured", "N/A"
 
-        cmd = config['tool_check']
-        tool_name = cmd[0]
-
-        try:
-            # Get the tool path
-            tool_path = self.get_tool_path(tool_name)
-
-            # Check version
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-            if result.returncode == 0:
-                version = result.stdout.strip() or result.stderr.strip()
-                status = "[OK]"
-                status_text = version.split('\n')[0]  # Take first line only
-            else:
-                status = "[NO]"
-                status_text = "Not available"
-
-            return status, status_text, tool_path
+        return _check_tool_cmd(spec.tool_check)
 
-        except FileNotFoundError:
-            return "[NO]", "Not found", self.get_tool_path(tool_name)
-        except subprocess.TimeoutExpired:
-            return "[TO]", "Timeout checking version", self.get_tool_path(tool_name)
-        except Exception as e:
-            return "[ERR]", f"Error: {str(e)}", self.get_tool_path(tool_name)
+    @classmethod
+    def invalidate_tool_cache(cls) -> None:
+        """Forget memoized tool lookups, e.g. after PATH or installed tools change."""
+        _get_tool_path.cache_clear()
+        _check_tool_cmd.cache_clear()
 
     def check_all_tools(self, check_all_languages: bool = False) -> None:
         """
@@ -281,11 +274,11 @@ class Language_Support:
 
         max_lang_len = max(len(lang[1:]) for lang in languages_to_check)  # Remove dot for display
 
-        results = []
-        for lang_ext in sorted(languages_to_check):
-            status, version, path = self.check_tool(lang_ext, check_all_languages)
-            lang_name = lang_ext[1:]  # Remove dot for display
-            results.append((lang_name, status, version, path))
+        # Each check waits on its own subprocess, so probe all languages at once
+        lang_exts = sorted(languages_to_check)
+        with ThreadPoolExecutor(max_workers=len(lang_exts)) as pool:
+            checks = pool.map(lambda ext: self.check_tool(ext, check_all_languages), lang_exts)
+            results = [(lang_ext[1:], *check) for lang_ext, check in zip(lang_exts, checks)]  # Remove dot for display
 
         # Print results
         for lang_name, status, version, path in results:
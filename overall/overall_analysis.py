@@ -5,6 +5,49 @@ from mpl_toolkits.mplot3d import Axes3D
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple, Union
 import re
+import io
+import os
+import csv
+import json
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from importlib.util import find_spec
+
+# Parsed tables are cached as parquet sidecars when pyarrow is installed
+_HAS_PYARROW = find_spec("pyarrow") is not None
+# Optional multithreaded engine for the grouped summaries
+_HAS_POLARS = find_spec("polars") is not None
+# Optional JIT for the grouped reductions of large frames
+_HAS_NUMBA = find_spec("numba") is not None
+_NUMBA_REDUCTIONS = frozenset({'mean', 'sum', 'min', 'max', 'std', 'var'})
+
+# Messages from parsing a file on a load_data worker thread are held here until the
+# main thread has printed that file's "Processing:" line
+_parse_log = threading.local()
+
+def _report(message: str) -> None:
+    """Print a parsing message, or hold it while load_data parses the file on a worker thread."""
+    pending = getattr(_parse_log, 'messages', None)
+    if pending is None:
+        print(message)
+    else:
+        pending.append(message)
+
+@functools.lru_cache(maxsize=16)
+def _find_repository_path(current_file: Optional[str], cwd: Optional[str]) -> Path:
+    """Memoized body of CodePerformanceAnalyzer.get_repository_path (cwd is only used without current_file)."""
+    if current_file:
+        current_file_path = Path(current_file).resolve()
+        return current_file_path.parent.parent
+
+    # Fallback: try to find the repository by looking for common patterns
+    current_dir = Path(cwd)
+    # Look for a parent directory that holds an analysis folder
+    for parent in [current_dir] + list(current_dir.parents):
+        if (parent / "analysis").is_dir():
+            return parent
+    return current_dir
 
 class CodePerformanceAnalyzer:
     """
@@ -16,17 +59,47 @@ class CodePerformanceAnalyzer:
     DEFAULT_RESULTS_PATTERN = "*_results.txt"
     TIME_THRESHOLD_MS = 15000  # Threshold for slow problems (15 seconds)
     MILLISECONDS_TO_SECONDS = 1/1000  # Conversion factor
+    # Per-challenge statistics, shared by analyze() and create_summary_plot()
+    CHALLENGE_AGGREGATIONS = {
+        'Avg_ms': ['count', 'mean', 'median', 'sum'],
+        'Avg_mb': ['mean', 'max', 'sum'],
+    }
+    NUMBA_MIN_ROWS = 10_000  # use_numba is ignored for smaller frames
+    COMBINED_CACHE = ".perf_cache.parquet"  # All rows of the last load_data run
+    COMBINED_MANIFEST = ".perf_cache.json"  # {file: [challenge, mtime_ns]} those rows came from
+    _DASH_RE = re.compile(rb'^\s*-+\s*$')
+    TABLE_COLUMNS = ["Problem", "Avg_ms", "STD_ms", "rel_ms", "Avg_mb", "STD_mb",
+                     "rel_mb", "Lang", "Size_kb", "Lines"]
+    # Compact storage for the label and count columns; the measurements stay float64 because
+    # float32 sums and medians of large timings go wrong in the second decimal
+    COLUMN_DTYPES = {
+        "Challenge": "category", "Problem": "int32",
+        "Avg_ms": "float64", "STD_ms": "float64", "rel_ms": "float64",
+        "Avg_mb": "float64", "STD_mb": "float64", "rel_mb": "float64",
+        "Lang": "category", "Size_kb": "float64", "Lines": "int32",
+    }
+    MEASUREMENT_COLUMNS = ("Avg_ms", "STD_ms", "rel_ms", "Avg_mb", "STD_mb", "rel_mb", "Size_kb")
     
-    def __init__(self, repo_path: Optional[Path] = None):
+    def __init__(self, repo_path: Optional[Path] = None, use_polars: bool = False,
+                 use_numba: bool = False):
         """
         Initialize the analyzer with a repository path.
         
         Args:
             repo_path: Path to the repository root. If None, will attempt to auto-detect.
+            use_polars: Run the grouped summaries with polars (if installed) instead of pandas
+            use_numba: Let pandas JIT the grouped reductions with numba (if installed) on large
+                frames; compilation takes seconds per process, so this only pays off for long sessions
         """
         self.repo_path = repo_path or self.get_repository_path()
         self.data = pd.DataFrame()
         self.analysis_results = {}
+        self.use_polars = use_polars and _HAS_POLARS
+        if use_polars and not _HAS_POLARS:
+            print("Warning: polars is not installed; using pandas")
+        self.use_numba = use_numba and _HAS_NUMBA
+        if use_numba and not _HAS_NUMBA:
+            print("Warning: numba is not installed; using pandas' default engine")
         
     @staticmethod
     def get_repository_path(current_file: Optional[str] = None) -> Path:
@@ -39,60 +112,163 @@ class CodePerformanceAnalyzer:
         Returns:
             Path object pointing to the repository root
         """
-        if current_file:
-            current_file_path = Path(current_file).resolve()
-            repo_path = current_file_path.parent.parent
-        else:
-            # Fallback: try to find the repository by looking for common patterns
-            current_dir = Path.cwd()
-            # Look for a parent directory that contains multiple challenge folders
-            for parent in [current_dir] + list(current_dir.parents):
-                if any((parent / "analysis").exists() for item in parent.iterdir() if item.is_dir()):
-                    repo_path = parent
-                    break
-            else:
-                repo_path = current_dir
-                
-        return repo_path
+        return _find_repository_path(current_file, None if current_file else str(Path.cwd()))
     
-    def parse_performance_file(self, file_path: Path, challenge_id: str) -> List[Dict[str, Any]]:
+    def parse_performance_file(self, file_path: Path, challenge_id: str) -> pd.DataFrame:
         """
-        Parses a single performance results file.
+        Parses a single performance results file, reusing its parquet sidecar when it is current.
         
         Args:
             file_path: Path to the results file
             challenge_id: The identifier for this challenge set
             
         Returns:
-            List of dictionaries containing parsed data
+            DataFrame with one row per problem (empty if nothing could be parsed)
+        """
+        cache_path = file_path.with_suffix('.parquet')
+        cached = self._read_parquet_cache(file_path, cache_path)
+        if cached is not None:
+            cached['Challenge'] = challenge_id
+            return cached
+
+        table = self._parse_results_text(file_path, challenge_id)
+        if not table.empty:
+            self._write_parquet_cache(table, cache_path)
+        return table
+
+    @classmethod
+    def _is_current_cache(cls, table: pd.DataFrame) -> bool:
+        """
+        Checks that a cached table stores every measurement as float64.
+        
+        Args:
+            table: Table read back from a parquet cache
+            
+        Returns:
+            False for caches written with float32 measurements, whose values are already rounded
+        """
+        return all(col in table and table[col].dtype == np.float64 for col in cls.MEASUREMENT_COLUMNS)
+
+    @classmethod
+    def _read_parquet_cache(cls, file_path: Path, cache_path: Path) -> Optional[pd.DataFrame]:
         """
+        Loads a parquet sidecar if pyarrow is available and it is at least as new as the results file.
+        
+        Args:
+            file_path: Path to the results file
+            cache_path: Path to its parquet sidecar
+            
+        Returns:
+            The cached DataFrame, or None if there is no usable cache
+        """
+        if not _HAS_PYARROW:
+            return None
         try:
-            with file_path.open('r') as f:
-                lines = f.readlines()
-        except FileNotFoundError:
-            print(f"Warning: File not found: {file_path}")
-            return []
-        except Exception as e:
-            print(f"Error reading file {file_path}: {e}")
-            return []
+            if cache_path.stat().st_mtime_ns < file_path.stat().st_mtime_ns:
+                return None
+            cached = pd.read_parquet(cache_path, engine='pyarrow')
+            return cached if cls._is_current_cache(cached) else None
+        except Exception:
+            # Missing, stale or unreadable sidecar: fall back to parsing the text
+            return None
+
+    @staticmethod
+    def _write_parquet_cache(table: pd.DataFrame, cache_path: Path) -> None:
+        """
+        Writes a parsed table next to its results file; failures only cost the cache.
         
-        # Find table boundaries
-        table_boundaries = []
-        for i, line in enumerate(lines):
-            if re.match(r'^-+$', line.strip()):  # Match lines with only dashes
-                table_boundaries.append(i)
+        Args:
+            table: Parsed results table
+            cache_path: Path to the parquet sidecar
+        """
+        if not _HAS_PYARROW:
+            return
+        try:
+            table.to_parquet(cache_path, engine='pyarrow', compression='zstd', index=False)
+        except Exception as e:
+            _report(f"Warning: Could not write cache {cache_path}: {e}")
+
+    def _parse_results_text(self, file_path: Path, challenge_id: str) -> pd.DataFrame:
+        """
+        Parses the text table of a single performance results file.
         
-        if len(table_boundaries) < 2:
-            print(f"Warning: Invalid table format in file: {file_path}")
-            return []
+        Args:
+            file_path: Path to the results file
+            challenge_id: The identifier for this challenge set
+            
+        Returns:
+            DataFrame with one row per problem (empty if nothing could be parsed)
+        """
+        # Stream the file, keeping only the rows between the first two lines of dashes
+        # and stopping at the second one (the totals and footer are never read)
+        table_lines = []
+        boundaries = 0
+        try:
+            with file_path.open('rb') as f:
+                for line in f:
+                    if self._DASH_RE.match(line):
+                        boundaries += 1
+                        if boundaries == 2:
+                            break
+                    elif boundaries:
+                        table_lines.append(line)
+        except FileNotFoundError:
+            _report(f"Warning: File not found: {file_path}")
+            return pd.DataFrame()
+        except Exception as e:
+            _report(f"Error reading file {file_path}: {e}")
+            return pd.DataFrame()
         
-        # Extract table content
+        if boundaries < 2:
+            _report(f"Warning: Invalid table format in file: {file_path}")
+            return pd.DataFrame()
+
+        # Fast path: let pandas' C tokenizer split the whole table and convert each column
+        # straight into its final dtype; the '%' columns are converted after stripping
+        read_dtypes = {
+            i: (str if col == 'Lang' else self.COLUMN_DTYPES[col])
+            for i, col in enumerate(self.TABLE_COLUMNS) if col not in ('rel_ms', 'rel_mb')
+        }
+        try:
+            table = pd.read_csv(io.BytesIO(b"".join(table_lines)), sep=r'\s+', engine='c',
+                                header=None, dtype=read_dtypes)
+        except (pd.errors.ParserError, pd.errors.EmptyDataError, UnicodeDecodeError, ValueError, TypeError):
+            # Ragged rows (e.g. multi-word language names) or a cell that is not a number:
+            # the row parser handles the former and reports and skips the latter
+            return self._parse_table_rows(table_lines, file_path, challenge_id)
+
+        if table.shape[1] != len(self.TABLE_COLUMNS) or table.isna().any().any():
+            return self._parse_table_rows(table_lines, file_path, challenge_id)
+
+        table.columns = self.TABLE_COLUMNS
+        try:
+            for col in ('rel_ms', 'rel_mb'):
+                if not pd.api.types.is_numeric_dtype(table[col]):
+                    table[col] = table[col].str.rstrip('%')
+                table[col] = table[col].astype(self.COLUMN_DTYPES[col])
+        except (ValueError, TypeError):
+            return self._parse_table_rows(table_lines, file_path, challenge_id)
+
+        table.insert(0, 'Challenge', challenge_id)
+        return table
+
+    def _parse_table_rows(self, table_lines: List[bytes], file_path: Path,
+                          challenge_id: str) -> pd.DataFrame:
+        """
+        Parses table rows one at a time, for tables the vectorized reader cannot handle.
+
+        Args:
+            table_lines: Lines between the two dash separators
+            file_path: Path to the results file (for warnings)
+            challenge_id: The identifier for this challenge set
+
+        Returns:
+            DataFrame with one row per parsed line
+        """
         data = []
-        table_start, table_end = table_boundaries[0] + 1, table_boundaries[1]
-        
-        for line in lines[table_start:table_end]:
+        for line in table_lines:
             line = line.strip()
-            if not line or line.startswith('-'):
+            if not line or line.startswith(b'-'):
                 continue
             
             # Split on whitespace but preserve language names with spaces
@@ -105,16 +281,18 @@ class CodePerformanceAnalyzer:
                 problem_num = int(parts[0])
                 avg_time = float(parts[1])
                 std_time = float(parts[2])
-                rel_time = float(parts[3].strip('%'))
+                rel_time = float(parts[3].strip(b'%'))
                 avg_mb = float(parts[4])
                 std_mb = float(parts[5])
-                rel_mb = float(parts[6].strip('%'))
+                rel_mb = float(parts[6].strip(b'%'))
                 file_size = float(parts[-2])  # Second to last
                 lines_count = int(parts[-1])  # Last
                 
-                # Language might be one or multiple words
-                lang_parts = parts[7:-2]
-                language = ' '.join(lang_parts)
+                # Language is almost always one word; only join for multi-word names
+                if len(parts) == 10:
+                    language = parts[7].decode(errors='replace')
+                else:
+                    language = b' '.join(parts[7:-2]).decode(errors='replace')
                 
                 data.append({
                     "Challenge": challenge_id,
@@ -130,10 +308,10 @@ class CodePerformanceAnalyzer:
                     "Lines": lines_count
                 })
             except (ValueError, IndexError) as e:
-                print(f"Warning: Error parsing line in {file_path}: {line}")
+                _report(f"Warning: Error parsing line in {file_path}: {line.decode(errors='replace')}")
                 continue
         
-        return data
+        return pd.DataFrame(data, columns=['Challenge', *self.TABLE_COLUMNS]) if data else pd.DataFrame()
     
     def find_results_files(self, pattern: str = DEFAULT_RESULTS_PATTERN) -> List[Tuple[Path, str]]:
         """
@@ -147,14 +325,12 @@ class CodePerformanceAnalyzer:
         """
         results_files = []
         
-        # Look for challenge folders (can be years, names, or any identifier)
-        for challenge_path in self.repo_path.iterdir():
-            if challenge_path.is_dir():
-                challenge_id = challenge_path.name
-                
-                # Search for results files in any subdirectory
-                for results_file in challenge_path.rglob(pattern):
-                    results_files.append((results_file, challenge_id))
+        # One walk of the whole tree; the challenge (a year, name or any identifier)
+        # is the top-level folder a file sits under, and files in the root itself are ignored
+        for results_file in self.repo_path.rglob(pattern):
+            rel_parts = results_file.relative_to(self.repo_path).parts
+            if len(rel_parts) > 1:
+                results_files.append((results_file, rel_parts[0]))
         
         return results_files
     
@@ -168,6 +344,9 @@ class CodePerformanceAnalyzer:
         Returns:
             DataFrame containing all parsed performance data
         """
+        # Earlier analysis results describe the previous data
+        self.analysis_results = {}
+
         if not self.repo_path.exists():
             print(f"Error: Repository folder does not exist: {self.repo_path}")
             return pd.DataFrame()
@@ -179,15 +358,119 @@ class CodePerformanceAnalyzer:
             print("Warning: No results files found")
             return pd.DataFrame()
         
-        # Parse all files
-        all_data = []
+        # Files whose mtime matches the manifest of the combined cache keep their cached rows
+        manifest = self._results_manifest(results_files)
+        old_manifest, cached_rows = self._read_combined_cache()
+        unchanged = {source for source, entry in manifest.items() if old_manifest.get(source) == entry}
+        to_parse = [(path, cid) for path, cid in results_files if str(path) not in unchanged]
+        if unchanged:
+            print(f"Using cached results for {len(unchanged)} unchanged file(s)")
+
+        # Parse the rest and combine the per-file tables in a single concat.
+        # Files are independent, and pandas' C reader and pyarrow release the GIL,
+        # so threads overlap the parsing without pickling frames between processes.
+        parsed_frames = {}
+        if to_parse:
+            with ThreadPoolExecutor(max_workers=min(len(to_parse), os.cpu_count() or 1)) as pool:
+                parsed = pool.map(lambda item: self._parse_with_log(*item), to_parse)
+                for (file_path, _), (challenge_data, messages) in zip(to_parse, parsed):
+                    print(f"Processing: {file_path}")
+                    for message in messages:
+                        print(message)
+                    if not challenge_data.empty:
+                        parsed_frames[str(file_path)] = challenge_data.assign(_source=str(file_path))
+
+        frames = []
+        for file_path, _ in results_files:
+            source = str(file_path)
+            if source in unchanged:
+                if source in cached_rows:
+                    frames.append(cached_rows[source])
+            elif source in parsed_frames:
+                frames.append(parsed_frames[source])
+        
+        if not frames:
+            self.data = pd.DataFrame()
+            return self.data
+
+        # Categories are assigned after the concat so they are unified across files
+        combined = pd.concat(frames, ignore_index=True).astype(self.COLUMN_DTYPES)
+        if to_parse or len(unchanged) != len(old_manifest):
+            self._write_combined_cache(combined, manifest)
+        self.data = combined.drop(columns='_source')
+        return self.data
+
+    def _parse_with_log(self, file_path: Path, challenge_id: str) -> Tuple[pd.DataFrame, List[str]]:
+        """
+        Parses a results file on a worker thread, holding back its warnings.
+        
+        Args:
+            file_path: Path to the results file
+            challenge_id: The identifier for this challenge set
+            
+        Returns:
+            The parsed table and the messages parsing it produced, in order
+        """
+        _parse_log.messages = messages = []
+        try:
+            return self.parse_performance_file(file_path, challenge_id), messages
+        finally:
+            _parse_log.messages = None
+
+    @staticmethod
+    def _results_manifest(results_files: List[Tuple[Path, str]]) -> Dict[str, List[Any]]:
+        """
+        Records what each results file looked like when it was loaded.
+        
+        Args:
+            results_files: (file_path, challenge_id) pairs from find_results_files
+            
+        Returns:
+            Mapping of file path -> [challenge_id, st_mtime_ns]
+        """
+        manifest = {}
         for file_path, challenge_id in results_files:
-            print(f"Processing: {file_path}")
-            challenge_data = self.parse_performance_file(file_path, challenge_id)
-            all_data.extend(challenge_data)
+            try:
+                manifest[str(file_path)] = [challenge_id, file_path.stat().st_mtime_ns]
+            except OSError:
+                continue
+        return manifest
+
+    def _read_combined_cache(self) -> Tuple[Dict[str, List[Any]], Dict[str, pd.DataFrame]]:
+        """
+        Loads the combined table written by the previous load_data run.
         
-        self.data = pd.DataFrame(all_data)
-        return self.data
+        Returns:
+            The previous manifest and its rows grouped by source file (both empty if unavailable)
+        """
+        if not _HAS_PYARROW:
+            return {}, {}
+        try:
+            manifest = json.loads((self.repo_path / self.COMBINED_MANIFEST).read_text(encoding="utf-8"))
+            combined = pd.read_parquet(self.repo_path / self.COMBINED_CACHE, engine='pyarrow')
+            if not self._is_current_cache(combined):
+                return {}, {}
+            return manifest, dict(tuple(combined.groupby('_source', sort=False)))
+        except Exception:
+            return {}, {}
+
+    def _write_combined_cache(self, combined: pd.DataFrame, manifest: Dict[str, List[Any]]) -> None:
+        """
+        Saves the combined table (with its _source column) and the manifest it was built from.
+        
+        Args:
+            combined: All parsed rows, tagged with their source file
+            manifest: Output of _results_manifest for the same files
+        """
+        if not _HAS_PYARROW:
+            return
+        try:
+            combined.to_parquet(self.repo_path / self.COMBINED_CACHE, engine='pyarrow',
+                                compression='zstd', index=False)
+            # Written last, so an interrupted write leaves a manifest that no longer matches
+            (self.repo_path / self.COMBINED_MANIFEST).write_text(json.dumps(manifest), encoding="utf-8")
+        except Exception as e:
+            print(f"Warning: Could not write combined cache in {self.repo_path}: {e}")
     
     def analyze(self) -> Dict[str, pd.DataFrame]:
         """
@@ -200,31 +483,95 @@ class CodePerformanceAnalyzer:
             print("Warning: No data to analyze")
             return {}
         
-        # Find slowest and fastest problems
-        slowest = self.data.nlargest(5, 'Avg_ms')
-        fastest = self.data.nsmallest(5, 'Avg_ms')
+        # Find slowest and fastest problems (same rows and order as nlargest/nsmallest)
+        avg_ms = self.data['Avg_ms'].to_numpy(dtype=np.float64)
+        slowest = self.data.iloc[self._extreme_positions(avg_ms, 5, largest=True)]
+        fastest = self.data.iloc[self._extreme_positions(avg_ms, 5, largest=False)]
         
         # Summary by language
-        lang_summary = self.data.groupby('Lang').agg({
+        lang_summary = self._grouped_summary('Lang', {
             'Avg_ms': ['count', 'mean', 'median', 'max'],
             'Avg_mb': ['mean', 'max']
         }).round(2)
         
-        # Summary by challenge
-        challenge_summary = self.data.groupby('Challenge').agg({
-            'Avg_ms': ['count', 'mean', 'median', 'sum'],
-            'Avg_mb': ['mean', 'max', 'sum']
-        }).round(2)
+        # Summary by challenge; the unrounded table is kept so create_summary_plot can reuse it
+        challenge_summary_wide = self._grouped_summary('Challenge', self.CHALLENGE_AGGREGATIONS)
+        challenge_summary = challenge_summary_wide.round(2)
         
         self.analysis_results = {
             'slowest': slowest,
             'fastest': fastest,
             'by_language': lang_summary,
-            'by_challenge': challenge_summary
+            'by_challenge': challenge_summary,
+            'challenge_summary_wide': challenge_summary_wide
         }
         
         return self.analysis_results
     
+    @staticmethod
+    def _extreme_positions(values: np.ndarray, k: int, largest: bool) -> np.ndarray:
+        """Row positions of the k largest (or smallest) values, like nlargest(keep='first').
+
+        An O(n) partition finds the boundary value; every row tied with it stays a
+        candidate, and the candidates are ordered by value, then by original position.
+        """
+        missing = np.isnan(values)
+        valid = np.flatnonzero(~missing)
+        keys = -values[valid] if largest else values[valid]
+        k_valid = min(k, len(keys))
+        if k_valid == 0:
+            picked = valid[:0]
+        else:
+            boundary = np.partition(keys, k_valid - 1)[k_valid - 1]
+            candidates = np.flatnonzero(keys <= boundary)
+            order = np.lexsort((candidates, keys[candidates]))[:k_valid]
+            picked = valid[candidates[order]]
+        # Like pandas, NaN rows only fill the places left over, in their original order
+        return np.concatenate((picked, np.flatnonzero(missing)[:k - k_valid]))
+
+    def _grouped_summary(self, key: str, aggregations: Dict[str, List[str]]) -> pd.DataFrame:
+        """
+        Aggregates self.data by one column, with pandas or (if enabled) polars.
+        
+        Args:
+            key: Column to group by
+            aggregations: Column name -> list of aggregation names
+            
+        Returns:
+            DataFrame indexed by key with (column, aggregation) MultiIndex columns (unrounded)
+        """
+        if not self.use_polars and self.use_numba and len(self.data) >= self.NUMBA_MIN_ROWS:
+            # Large frames: reductions numba can JIT run as parallel kernels; count and median stay on Cython
+            grouped = self.data.groupby(key, observed=True)
+            numba_kwargs = {'engine': 'numba', 'engine_kwargs': {'parallel': True, 'nogil': True}}
+            summary = pd.concat({
+                (col, fn): getattr(grouped[col], fn)(**(numba_kwargs if fn in _NUMBA_REDUCTIONS else {}))
+                for col, fns in aggregations.items() for fn in fns
+            }, axis=1)
+            return summary
+
+        if not self.use_polars:
+            # A single groupby computes every statistic; the dict-of-lists form is kept over
+            # named aggregations since it builds the (column, statistic) header directly and
+            # was not slower on categorical keys
+            return self.data.groupby(key, observed=True).agg(aggregations)
+
+        import polars as pl
+
+        columns = [(col, fn) for col, fns in aggregations.items() for fn in fns]
+        summary = (
+            pl.from_pandas(self.data[[key, *aggregations]])
+            .lazy()
+            .group_by(key)
+            .agg([getattr(pl.col(col), fn)().alias(f"{col}_{fn}") for col, fn in columns])
+            .sort(key)
+            .collect()
+            .to_pandas()
+            .set_index(key)
+        )
+        summary.columns = pd.MultiIndex.from_tuples(columns)
+        return summary
+
     def print_summary(self):
         """Prints a formatted summary of the analysis."""
         if not self.analysis_results:
@@ -247,12 +594,13 @@ class CodePerformanceAnalyzer:
         print("\nSUMMARY BY CHALLENGE:")
         print(self.analysis_results['by_challenge'].to_string())
     
-    def create_summary_plot(self, output_dir: Path) -> Optional[pd.DataFrame]:
+    def create_summary_plot(self, output_dir: Path, show: bool = False) -> Optional[pd.DataFrame]:
         """
         Creates and saves a visualization of challenge performance.
         
         Args:
             output_dir: Directory to save the plot
+            show: Also display the plot window (blocks until it is closed)
             
         Returns:
             Summary DataFrame if successful, None otherwise
@@ -261,27 +609,37 @@ class CodePerformanceAnalyzer:
             print("Warning: No data to plot")
             return None
             
-        # Summary by challenge
-        summary = self.data.groupby('Challenge').agg(
-            Total_Time_ms=('Avg_ms', 'sum'),
-            Average_Time_ms=('Avg_ms', 'mean'),
-            Median_Time_ms=('Avg_ms', 'median'),
-            Total_Memory_mb=('Avg_mb', 'sum'),
-        ).reset_index()
+        # Summary by challenge, reusing the one analyze() computed when available
+        wide = self.analysis_results.get('challenge_summary_wide')
+        if wide is None:
+            wide = self._grouped_summary('Challenge', self.CHALLENGE_AGGREGATIONS)
+        summary = pd.DataFrame({
+            # Plain strings, as before the Challenge column became categorical
+            'Challenge': wide.index.astype(str),
+            'Total_Time_ms': wide[('Avg_ms', 'sum')].to_numpy(),
+            'Average_Time_ms': wide[('Avg_ms', 'mean')].to_numpy(),
+            'Median_Time_ms': wide[('Avg_ms', 'median')].to_numpy(),
+            'Total_Memory_mb': wide[('Avg_mb', 'sum')].to_numpy(),
+        })
 
         # Create figure
-        fig, ax = plt.subplots(figsize=(12, 7))
+        # Constrained layout is solved while drawing, so saving needs no extra layout or bbox pass
+        fig, ax = plt.subplots(figsize=(12, 7), layout='constrained')
         
+        # Plain arrays for everything drawn below, so matplotlib never indexes into Series
+        total_memory_mb = summary['Total_Memory_mb'].to_numpy()
+        positions = np.arange(len(summary))
+
         # Normalize memory usage for color mapping
-        norm = plt.Normalize(summary['Total_Memory_mb'].min(), summary['Total_Memory_mb'].max())
-        colors = plt.cm.viridis(norm(summary['Total_Memory_mb']))
+        norm = plt.Normalize(total_memory_mb.min(), total_memory_mb.max())
+        colors = plt.cm.viridis(norm(total_memory_mb))
         
         # Convert time to seconds for more readable axis
-        total_time_seconds = summary['Total_Time_ms'] * self.MILLISECONDS_TO_SECONDS
+        total_time_seconds = summary['Total_Time_ms'].to_numpy() * self.MILLISECONDS_TO_SECONDS
         
         # Create bar plot
         bars = ax.bar(
-            range(len(summary['Challenge'])), 
+            positions, 
             total_time_seconds, 
             color=colors, 
             edgecolor='black', 
@@ -300,27 +658,26 @@ class CodePerformanceAnalyzer:
         ax.set_title('Code Challenges: Performance Summary', fontsize=16, pad=20)
         ax.set_xlabel('Challenge Set', fontsize=12)
         ax.set_ylabel('Total Execution Time (seconds)', fontsize=12)
-        ax.set_xticks(range(len(summary['Challenge'])))
-        ax.set_xticklabels(summary['Challenge'], rotation=45)
+        ax.set_xticks(positions)
+        ax.set_xticklabels(summary['Challenge'].astype(str).tolist(), rotation=45)
         
         # Add grid for better readability
         ax.grid(visible=True, which='major', color='grey', axis='y', 
                 linestyle='--', linewidth=0.7, alpha=0.7, zorder=1)
         
         # Add value labels on top of bars
-        for i, (challenge, value) in enumerate(zip(summary['Challenge'], total_time_seconds)):
-            ax.text(i, value + max(total_time_seconds)*0.01, 
-                    f'{value:.1f}s', ha='center', va='bottom', fontsize=9)
-        
-        plt.tight_layout()
+        ax.bar_label(bars, labels=[f'{value:.1f}s' for value in total_time_seconds],
+                     padding=3, fontsize=9)
         
         # Save the plot
         output_dir.mkdir(parents=True, exist_ok=True)
         plot_path = output_dir / 'performance_summary.png'
-        plt.savefig(plot_path, dpi=150, bbox_inches='tight')
+        plt.savefig(plot_path, dpi=150)
         print(f"Plot saved to {plot_path}")
         
-        plt.show()
+        if show:
+            plt.show()
+        plt.close(fig)
         return summary
     
     def export_slow_problems(self, output_dir: Path, 
@@ -339,31 +696,44 @@ class CodePerformanceAnalyzer:
             print("Warning: No data to export")
             return Path()
             
-        slow_problems = self.data[self.data['Avg_ms'] >= threshold_ms].copy()
-        
-        # Convert time to seconds for readability
-        slow_problems['Avg_seconds'] = slow_problems['Avg_ms'] * self.MILLISECONDS_TO_SECONDS
-        slow_problems = slow_problems[['Challenge', 'Problem', 'Avg_seconds', 'Avg_mb', 'Lang']]
+        # Select the slow rows straight from the column arrays
+        mask = self.data['Avg_ms'].to_numpy() >= threshold_ms
+        avg_seconds = self.data['Avg_ms'].to_numpy()[mask] * self.MILLISECONDS_TO_SECONDS
+        columns = (
+            self.data['Challenge'].to_numpy()[mask],
+            self.data['Problem'].to_numpy()[mask],
+            avg_seconds,  # Time in seconds for readability
+            self.data['Avg_mb'].to_numpy()[mask],
+            self.data['Lang'].to_numpy()[mask],
+        )
         
-        # Sort by time (descending)
-        slow_problems = slow_problems.sort_values('Avg_seconds', ascending=False)
+        # Sort by time (descending); stable so ties keep their load order
+        order = np.argsort(-avg_seconds, kind='stable')
         
         # Create output directory if it doesn't exist
         output_dir.mkdir(parents=True, exist_ok=True)
         output_file = output_dir / f"slow_problems_over_{threshold_ms//1000}s.txt"
         
-        # Save to file
-        slow_problems.to_csv(output_file, sep="\t", index=False, float_format="%.2f")
-        
-        print(f"Exported {len(slow_problems)} slow problems to {output_file}")
+        # Save to file, formatting each value once instead of through pandas' per-cell formatters
+        challenges, problems, seconds, memory, langs = (col[order] for col in columns)
+        with output_file.open('w', newline='') as f:
+            writer = csv.writer(f, delimiter='\t', lineterminator='\n')
+            writer.writerow(['Challenge', 'Problem', 'Avg_seconds', 'Avg_mb', 'Lang'])
+            writer.writerows(
+                (challenge, problem, f'{secs:.2f}', f'{mb:.2f}', lang)
+                for challenge, problem, secs, mb, lang in zip(challenges, problems.tolist(), seconds.tolist(), memory.tolist(), langs)
+            )
+        
+        print(f"Exported {len(order)} slow problems to {output_file}")
         return output_file
     
-    def run_full_analysis(self, output_dir: Optional[Path] = None):
+    def run_full_analysis(self, output_dir: Optional[Path] = None, show: bool = False):
         """
         Runs the complete analysis pipeline.
         
         Args:
             output_dir: Directory to save outputs. If None, uses default location.
+            show: Display the summary plot as well as saving it
         """
         if output_dir is None:
             output_dir = Path(__file__).parent / "performance_analysis_output"
@@ -384,7 +754,7 @@ class CodePerformanceAnalyzer:
         self.print_summary()
         
         # Create visualizations and exports
-        self.create_summary_plot(output_dir)
+        self.create_summary_plot(output_dir, show=show)
         self.export_slow_problems(output_dir)
         
         print(f"\nAnalysis complete. Results saved to {output_dir}")
@@ -396,7 +766,7 @@ if __name__ == "__main__":
     analyzer = CodePerformanceAnalyzer()
     
     # Run full analysis
-    analyzer.run_full_analysis()
+    analyzer.run_full_analysis(show=True)
     
     # Alternatively, use step-by-step:
     # analyzer.load_data()